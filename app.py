@@ -2,6 +2,25 @@ import streamlit as st
 from src.resume_loader import ResumeLoaderFactory
 from src.job_extractor import JobExtractor
 from src.message_writer import MessageWriter
+from src.message_cache import MessageCache
+
+@st.cache_resource
+def get_message_cache():
+    # Shared across sessions and reruns, so repeat clicks are served without calling the model
+    return MessageCache()
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def extract_job(job_url, job_description=None):
+    # Keyed on the raw job URL / description; failures raise and are therefore not cached
+    extractor = JobExtractor()
+    if job_url:
+        job_description = extractor.parse_job_from_web(job_url)
+
+    job = extractor.extract_jobdata(job_description)
+    if not job or not job.get('job_postings'):
+        raise ValueError(f"Cannot fetch job details from this url: {job_url}, Use the 'Job Description' field for better assistance!")
+
+    return job
 
 def main():
     # Set the page layout to wide mode
@@ -54,7 +73,9 @@ def main():
             "Paste the Job Description",
             placeholder="Copy and paste the job description here..."
         )
-        
+
+    # Number of alternative messages generated per request, served in turn on each regeneration
+    num_variants = st.slider("Message variants per request", min_value=1, max_value=5, value=1)
 
     # Button to trigger the flow
     if st.button("Generate Message"):
@@ -62,7 +83,7 @@ def main():
             try:
                 st.info("Processing your request...")
                 # Trigger the flow (replace with your logic)
-                thought, response = generate_message_for_job(job_url, uploaded_file, job_description)
+                thought, response = generate_message_for_job(job_url, uploaded_file, job_description, num_variants)
 
                 # Create two columns for displaying outputs side by side
                 col1, col2 = st.columns(2)
@@ -83,7 +104,7 @@ def main():
         else:
             st.error("Please provide a valid job URL.")
 
-def generate_message_for_job(job_url, uploaded_file, job_description=None):
+def generate_message_for_job(job_url, uploaded_file, job_description=None, num_variants=1):
     
     # Load the resume using the appropriate method (PDF or text)
     if uploaded_file:
@@ -93,17 +114,11 @@ def generate_message_for_job(job_url, uploaded_file, job_description=None):
         resume_loader = ResumeLoaderFactory.create_loader("text")
         resume = resume_loader.load_resume()
 
-    # Extract the key info from job URL
-    extractor = JobExtractor()
-    if job_url:
-        job_description = extractor.parse_job_from_web(job_url)
-
-    job = extractor.extract_jobdata(job_description)
-    if not job or not job.get('job_postings'):
-        raise ValueError(f"Cannot fetch job details from this url: {job_url}, Use the 'Job Description' field for better assistance!")
+    # Extract the key info from job URL (cached on the raw input, so regenerating skips scraping and extraction)
+    job = extract_job(job_url, job_description)
 
     # Invoke chat model
-    writer = MessageWriter()
+    writer = MessageWriter(num_variants=num_variants, cache=get_message_cache())
     thought, message = writer.write_message(job, resume)
 
     return thought, message
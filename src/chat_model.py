@@ -10,12 +10,19 @@ class ChatModel:
     groq : ChatGroq
         The instance of the `ChatGroq` class used for generating responses from the Groq model.
         The model is initialized with specific configuration parameters like temperature, API key, and model type.
+    model_name : str
+        The name of the Groq model in use. It is part of the message cache key.
     """
     
-    def __init__(self):
+    def __init__(self, temperature=0):
         """
         Initializes the ChatModel class and sets up the ChatGroq instance for communication with the Groq model.
 
+        Parameters:
+        -----------
+        temperature : float
+            The sampling temperature passed to the model. Defaults to 0 for deterministic output.
+
         The constructor sets up the model configuration, including:
         - `temperature`: Controls the randomness of the model's responses. Lower values (e.g., 0) make the output more deterministic.
         - `api_key`: The API key required to authenticate requests to the Groq model, fetched from the environment variables.
@@ -35,9 +42,11 @@ class ChatModel:
         if not api_key:
             raise EnvironmentError("GROQ_API_KEY environment variable not set.")
         
+        self.model_name = "deepseek-r1-distill-llama-70b"
+
         # Initialize the Groq model with the given configuration
         self.groq = ChatGroq(
-            temperature=0, 
+            temperature=temperature, 
             api_key=api_key, 
-            model="deepseek-r1-distill-llama-70b"
+            model=self.model_name
         )
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+import hashlib
+import json
+import threading
+
+
+class MessageCache:
+    """
+    An in-memory, thread-safe cache of generated recruiter messages.
+
+    Each entry is keyed on the resume content, the normalized job JSON, the prompt version, the model name and the
+    generation settings (temperature and number of variants), and holds one or more `(thought, message)` variants.
+    Repeated lookups for the same key are served round-robin, so every "regenerate" returns the next stored variant
+    without calling the model again.
+
+    Attributes:
+    -----------
+    max_entries : int
+        The maximum number of keys kept in the cache. The least recently used entry is evicted first.
+
+    Methods:
+    --------
+    make_key(job, resume, prompt_version: str, model: str, temperature: float, num_variants: int) -> str:
+        Builds the cache key for a job and resume pair.
+
+    get(key: str) -> tuple:
+        Returns the next stored `(thought, message)` variant for the key, or None on a cache miss.
+
+    put(key: str, variants: list) -> tuple:
+        Stores the generated variants for the key and returns the first one.
+    """
+
+    def __init__(self, max_entries=128):
+        """
+        Initializes the MessageCache instance with an empty store.
+
+        Parameters:
+        -----------
+        max_entries : int
+            The maximum number of keys kept in the cache before evicting the least recently used one.
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(job, resume, prompt_version, model, temperature, num_variants):
+        """
+        Builds the cache key for a job and resume pair.
+
+        Parameters:
+        -----------
+        job : dict
+            The extracted job data. It is serialized with sorted keys so equivalent JSON maps to the same key.
+        resume : object
+            The resume document (or its raw text). Only the text content is hashed.
+        prompt_version : str
+            The version of the prompt used to generate the message.
+        model : str
+            The name of the model used to generate the message.
+        temperature : float
+            The sampling temperature used to generate the message.
+        num_variants : int
+            The number of variants generated per request.
+
+        Returns:
+        --------
+        str:
+            A SHA-256 hex digest identifying the request.
+        """
+        resume_text = getattr(resume, "page_content", resume)
+        resume_hash = hashlib.sha256(str(resume_text).encode("utf-8")).hexdigest()
+        job_json = json.dumps(job, sort_keys=True, separators=(",", ":"), default=str)
+
+        payload = json.dumps([resume_hash, job_json, prompt_version, model, temperature, num_variants])
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key):
+        """
+        Returns the next stored variant for the key, cycling through the variants on each call.
+
+        Parameters:
+        -----------
+        key : str
+            The cache key built by `make_key`.
+
+        Returns:
+        --------
+        tuple:
+            The `(thought, message)` variant to serve, or None if the key is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+            variant = entry["variants"][entry["cursor"]]
+            entry["cursor"] = (entry["cursor"] + 1) % len(entry["variants"])
+            return variant
+
+    def put(self, key, variants):
+        """
+        Stores the generated variants for the key, replacing any existing entry, and returns the first variant.
+        The cursor is advanced past it under the same lock, so the next lookup serves the second variant.
+
+        Parameters:
+        -----------
+        key : str
+            The cache key built by `make_key`.
+        variants : list
+            A non-empty list of `(thought, message)` tuples.
+
+        Returns:
+        --------
+        tuple:
+            The first `(thought, message)` variant.
+
+        Raises:
+        -------
+        ValueError:
+            If no variants are provided.
+        """
+        if not variants:
+            raise ValueError("At least one message variant must be provided.")
+
+        with self._lock:
+            variants = list(variants)
+            self._entries[key] = {"variants": variants, "cursor": 1 % len(variants)}
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+            return variants[0]
@@ -1,8 +1,15 @@
 from src.chat_model import ChatModel
+from src.message_cache import MessageCache
 from langchain_core.prompts import PromptTemplate
 import re
 import requests
 
+# Bump whenever `message_prompt` changes so previously cached messages are not served
+PROMPT_VERSION = "1"
+
+# Sampling temperature used when generating more than one variant, so the alternatives differ
+VARIANT_TEMPERATURE = 0.7
+
 class MessageWriter:
     """
     A class that generates personalized email messages for recruiters based on job descriptions and resumes.
@@ -15,6 +22,12 @@ class MessageWriter:
         An instance of the ChatModel used to process the job description and resume, and generate the email content.
     message_prompt : PromptTemplate
         The template used to instruct the model on how to structure the email content based on the job and resume details.
+    num_variants : int
+        The number of alternative emails generated per request.
+    temperature : float
+        The sampling temperature passed to the model.
+    cache : MessageCache
+        The cache of generated messages, or None to always call the model.
 
     Methods:
     --------
@@ -23,11 +36,25 @@ class MessageWriter:
         and returns both the extracted thought process and cleaned email content.
     """
 
-    def __init__(self):
+    def __init__(self, num_variants=1, cache=None):
         """
         Initializes the MessageWriter instance with the necessary models and prompt template for email generation.
+
+        Parameters:
+        -----------
+        num_variants : int
+            The number of alternative emails to generate per request. When greater than 1, the variants are
+            generated in parallel with `VARIANT_TEMPERATURE` so they differ from each other.
+        cache : MessageCache
+            An optional cache shared across requests. Cached variants are served round-robin on regeneration.
         """
-        self.chat_model = ChatModel()
+        if num_variants < 1:
+            raise ValueError("num_variants must be at least 1.")
+
+        self.num_variants = num_variants
+        self.temperature = 0 if num_variants == 1 else VARIANT_TEMPERATURE
+        self.cache = cache
+        self.chat_model = ChatModel(temperature=self.temperature)
 
         # Define the prompt template for generating recruiter emails
         self.message_prompt = PromptTemplate.from_template(
@@ -70,6 +97,8 @@ class MessageWriter:
     def write_message(self, job, resume):
         """
         Generates a personalized email message for the recruiter based on the provided job description and resume.
+        If a cache is configured and already holds messages for this job and resume, the next stored variant is
+        returned without calling the model.
 
         Parameters:
         -----------
@@ -89,33 +118,34 @@ class MessageWriter:
         -------
         ValueError: If there is an error in invoking the model chain or processing the response.
         """
+        cache_key = None
+        if self.cache is not None:
+            cache_key = MessageCache.make_key(
+                job, resume, PROMPT_VERSION, self.chat_model.model_name, self.temperature, self.num_variants
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                print("=== Serving cached message ===")
+                return cached
+
         try:
             # Create the chain of prompt and model invocation
             message_chain = self.message_prompt | self.chat_model.groq
+            inputs = {"job_description": job, "resume": resume}
 
-            # Invoke the model to generate the email content
-            res = message_chain.invoke(input={"job_description": job, "resume": resume})
-
-            # Extract the thought process (if any) enclosed in <think> tags
-            think_content = re.findall(r'<think>(.*?)</think>', res.content, flags=re.DOTALL)
-            cleaned_response = re.sub(r'<think>.*?</think>', '', res.content, flags=re.DOTALL)
-
-            # Check if content was found
-            if think_content:
-                # Get the first element from the list (since re.findall returns a list)
-                extracted_text = think_content[0]
-                extracted_text = extracted_text.strip()  # Strip leading/trailing whitespace and newlines
-
-                # Print the well-formatted text
-                print(f"=== Thought Process ===\n {extracted_text}")
-                think_content = extracted_text
+            # Invoke the model to generate the email content, running the variants in parallel
+            if self.num_variants == 1:
+                responses = [message_chain.invoke(input=inputs)]
             else:
-                print("No content found between <think> and </think> tags.")
+                responses = message_chain.batch([inputs] * self.num_variants)
+
+            variants = [self._parse_response(res.content) for res in responses]
 
-            print(f"=== Cleaned Response ===\n {cleaned_response}")
+            if cache_key is not None:
+                # Store the variants and get the first one back atomically, so the next call serves a new one
+                return self.cache.put(cache_key, variants)
 
-            # Return the extracted thought process and the cleaned email content
-            return think_content, cleaned_response.strip()
+            return variants[0]
         except requests.exceptions.HTTPError as http_err:
             if http_err.response.status_code == 413:
                 raise ValueError("The input is too large. Please reduce the size and try again.")
@@ -126,3 +156,38 @@ class MessageWriter:
         except Exception as e:
             # Raise a ValueError with additional context if there was an error in processing
             raise ValueError(f"An error occurred while generating the email: {e}") from e
+
+    def _parse_response(self, content):
+        """
+        Splits a raw model response into its thought process and the cleaned email content.
+
+        Parameters:
+        -----------
+        content : str
+            The raw response content returned by the model.
+
+        Returns:
+        --------
+        tuple:
+            A tuple containing the thought process and the cleaned email content.
+        """
+        # Extract the thought process (if any) enclosed in <think> tags
+        think_content = re.findall(r'<think>(.*?)</think>', content, flags=re.DOTALL)
+        cleaned_response = re.sub(r'<think>.*?</think>', '', content, flags=re.DOTALL)
+
+        # Check if content was found
+        if think_content:
+            # Get the first element from the list (since re.findall returns a list)
+            extracted_text = think_content[0]
+            extracted_text = extracted_text.strip()  # Strip leading/trailing whitespace and newlines
+
+            # Print the well-formatted text
+            print(f"=== Thought Process ===\n {extracted_text}")
+            think_content = extracted_text
+        else:
+            print("No content found between <think> and </think> tags.")
+
+        print(f"=== Cleaned Response ===\n {cleaned_response}")
+
+        # Return the extracted thought process and the cleaned email content
+        return think_content, cleaned_response.strip()